@@ -0,0 +1,226 @@
+import asyncio
+import json
+import logging
+from datetime import datetime, timezone
+from typing import Optional
+import aiohttp
+import pandas as pd
+from twitter_scraper import Article, build_search_query, articles_to_dataframe
+
+# Public bearer token used by the twitter.com web client
+BEARER_TOKEN = (
+    "AAAAAAAAAAAAAAAAAAAAANRILgAAAAAAnNwIzUejRCOuH5E6I8xnZz4puTs"
+    "%3D1Zv7ttfk8LF81IUq16cHjhLTvJu4FA33AGWWjCpTnA"
+)
+
+# Twitter rotates GraphQL query ids when the web client is redeployed
+SEARCH_TIMELINE_QUERY_ID = "nK1dw4oV3k4w5TdtcAdSww"
+
+SEARCH_TIMELINE_FEATURES = {
+    "rweb_lists_timeline_redesign_enabled": True,
+    "responsive_web_graphql_exclude_directive_enabled": True,
+    "verified_phone_label_enabled": False,
+    "creator_subscriptions_tweet_preview_api_enabled": True,
+    "responsive_web_graphql_timeline_navigation_enabled": True,
+    "responsive_web_graphql_skip_user_profile_image_extensions_enabled": False,
+    "tweetypie_unmention_optimization_enabled": True,
+    "responsive_web_edit_tweet_api_enabled": True,
+    "graphql_is_translatable_rweb_tweet_is_translatable_enabled": True,
+    "view_counts_everywhere_api_enabled": True,
+    "longform_notetweets_consumption_enabled": True,
+    "responsive_web_twitter_article_tweet_consumption_enabled": False,
+    "tweet_awards_web_tipping_enabled": False,
+    "freedom_of_speech_not_reach_fetch_enabled": True,
+    "standardized_nudges_misinfo": True,
+    "tweet_with_visibility_results_prefer_gql_limited_actions_policy_enabled": True,
+    "longform_notetweets_rich_text_read_enabled": True,
+    "longform_notetweets_inline_media_enabled": True,
+    "responsive_web_media_download_video_enabled": False,
+    "responsive_web_enhance_cards_enabled": False,
+}
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+class AsyncTwitterScraper:
+    """
+    Scrape search results from Twitter's SearchTimeline GraphQL endpoint
+    with aiohttp, without driving a browser.
+
+    format_articles returns the same columns as TwitterScraper, but Post Text
+    holds only the tweet body, where TwitterScraper stores the whole article's
+    text including display name, handle, relative time and engagement counts.
+    """
+    def __init__(
+            self,
+            search_query: str,
+            from_account: Optional[str] = None,
+            start_date: Optional[str] = None,
+            end_date: Optional[str] = None,
+            page_size:int=20,
+            max_retries:int=5,
+            backoff_base:float=1.0,
+            query_id:str=SEARCH_TIMELINE_QUERY_ID,
+            semaphore: Optional[asyncio.Semaphore] = None
+        ):
+        self.search_query = search_query
+        self.from_account = from_account
+        self.start_date = start_date
+        self.end_date = end_date
+        self.page_size = page_size
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.query_id = query_id
+        # Pass a shared semaphore to rate limit several scrapers run together
+        self.semaphore = semaphore
+        self.cookies = {}
+        self.articles = {}
+        self._raw_query = build_search_query(search_query, from_account, start_date, end_date)
+
+    def load_cookies(self, cookie_file):
+        """Load cookies from the same JSON file used by TwitterScraper"""
+        try:
+            with open(cookie_file, 'r') as f:
+                cookies = json.load(f)
+        except FileNotFoundError:
+            logging.error(f"Cookie file {cookie_file} not found")
+            raise
+        self.cookies = {cookie['name']: cookie['value'] for cookie in cookies}
+        if 'ct0' not in self.cookies:
+            logging.warning("No ct0 cookie found, requests will fail the CSRF check")
+
+    def _headers(self) -> dict:
+        return {
+            "authorization": f"Bearer {BEARER_TOKEN}",
+            "x-csrf-token": self.cookies.get('ct0', ''),
+            "x-twitter-auth-type": "OAuth2Session",
+            "x-twitter-active-user": "yes",
+            "content-type": "application/json",
+        }
+
+    async def _fetch_page(self, session: aiohttp.ClientSession, cursor: Optional[str]) -> dict:
+        """Fetch one page of search results, backing off on rate limits, server and connection errors"""
+        variables = {
+            "rawQuery": self._raw_query,
+            "count": self.page_size,
+            "querySource": "typed_query",
+            "product": "Latest",
+        }
+        if cursor:
+            variables["cursor"] = cursor
+        params = {
+            "variables": json.dumps(variables),
+            "features": json.dumps(SEARCH_TIMELINE_FEATURES),
+        }
+        url = f"https://x.com/i/api/graphql/{self.query_id}/SearchTimeline"
+
+        for attempt in range(self.max_retries):
+            try:
+                async with self.semaphore:
+                    async with session.get(url, params=params) as response:
+                        if response.status not in RETRY_STATUSES:
+                            response.raise_for_status()
+                            return await response.json()
+                        error = f"status {response.status}"
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                error = repr(e)
+
+            if attempt == self.max_retries - 1:
+                break
+            delay = self.backoff_base * 2 ** attempt
+            logging.warning(f"SearchTimeline failed with {error}, retrying in {delay}s")
+            await asyncio.sleep(delay)
+        raise RuntimeError(f"SearchTimeline still failing after {self.max_retries} attempts")
+
+    @staticmethod
+    def _parse_tweet(result: dict) -> Optional[tuple]:
+        """Convert a tweet result into its id and the same Article record TwitterScraper collects"""
+        if result.get('__typename') == 'TweetWithVisibilityResults':
+            result = result['tweet']
+        legacy = result.get('legacy')
+        # Tombstones have no legacy body, and without an id tweets would collapse into one key
+        if not legacy or not result.get('rest_id'):
+            return None
+
+        note = result.get('note_tweet', {}).get('note_tweet_results', {}).get('result', {})
+        text = note.get('text') or legacy.get('full_text', '')
+
+        media = legacy.get('extended_entities', legacy.get('entities', {})).get('media', [])
+        image_url = media[0].get('media_url_https') if media else None
+
+        # Match the ISO format of the <time datetime> attribute the browser scraper reads
+        created_at = datetime.strptime(legacy['created_at'], "%a %b %d %H:%M:%S %z %Y")
+        timestamp = created_at.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
+        return result['rest_id'], Article(timestamp, text, image_url)
+
+    def _parse_page(self, data: dict) -> tuple:
+        """Return the tweets on a page and the cursor for the next one"""
+        instructions = (
+            data.get('data', {})
+            .get('search_by_raw_query', {})
+            .get('search_timeline', {})
+            .get('timeline', {})
+            .get('instructions', [])
+        )
+        entries = []
+        for instruction in instructions:
+            if instruction.get('type') == 'TimelineAddEntries':
+                entries.extend(instruction.get('entries', []))
+            elif instruction.get('type') == 'TimelineReplaceEntry':
+                entries.append(instruction.get('entry', {}))
+
+        tweets = []
+        cursor = None
+        for entry in entries:
+            content = entry.get('content', {})
+            if content.get('cursorType') == 'Bottom':
+                cursor = content.get('value')
+                continue
+            result = content.get('itemContent', {}).get('tweet_results', {}).get('result')
+            if result:
+                tweet = self._parse_tweet(result)
+                if tweet:
+                    tweets.append(tweet)
+        return tweets, cursor
+
+    async def scrape(self, max_pages=None, new_content_retries=3) -> list:
+        """Page through the search results following the bottom cursor"""
+        if self.semaphore is None:
+            self.semaphore = asyncio.Semaphore(10)
+        logging.info(f"Starting search for: {self.search_query}")
+
+        async with aiohttp.ClientSession(headers=self._headers(), cookies=self.cookies) as session:
+            cursor = None
+            page_count = 0
+            no_new_content_count = 0
+            while True:
+                if max_pages and page_count >= max_pages:
+                    logging.info("Reached maximum page limit")
+                    break
+
+                data = await self._fetch_page(session, cursor)
+                tweets, cursor = self._parse_page(data)
+
+                prev_count = len(self.articles)
+                for tweet_id, article in tweets:
+                    self.articles.setdefault(tweet_id, article)
+                page_count += 1
+                logging.info(f"Page {page_count}: Found {len(self.articles)} unique articles")
+
+                if not cursor:
+                    logging.info("Reached end of search results")
+                    break
+
+                if len(self.articles) == prev_count:
+                    no_new_content_count += 1
+                    if no_new_content_count >= new_content_retries:  # Try this many times before giving up
+                        logging.info("No new content found after multiple attempts")
+                        break
+                else:
+                    no_new_content_count = 0
+
+        return list(self.articles.values())
+
+    def format_articles(self) -> pd.DataFrame:
+        """Format the scraped articles as a DataFrame"""
+        return articles_to_dataframe(list(self.articles.values()))
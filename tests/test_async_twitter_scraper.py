@@ -0,0 +1,69 @@
+import json
+from pathlib import Path
+from async_twitter_scraper import AsyncTwitterScraper
+from twitter_scraper import Article, articles_to_dataframe
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def load_page():
+    with open(FIXTURES / "search_timeline_page.json", encoding='utf-8') as f:
+        return json.load(f)
+
+
+def test_parse_page_extracts_tweets_and_bottom_cursor():
+    tweets, cursor = AsyncTwitterScraper("nasa")._parse_page(load_page())
+
+    assert cursor == "DAADDAABCgABBOTTOM"
+    assert tweets == [
+        ("1750000000000000001", Article(
+            "2025-01-24T14:47:25.000Z",
+            "Liftoff! https://t.co/abc123",
+            "https://pbs.twimg.com/media/GEXTENDED.jpg",
+        )),
+        ("1750000000000000002", Article(
+            "2025-01-24T04:05:00.000Z",
+            "A long note tweet that is not truncated",
+            None,
+        )),
+    ]
+
+
+def test_parse_tweet_skips_tombstones_and_missing_ids():
+    parse = AsyncTwitterScraper._parse_tweet
+    assert parse({"__typename": "TweetTombstone", "tombstone": {}}) is None
+    assert parse({
+        "__typename": "Tweet",
+        "legacy": {"created_at": "Fri Jan 24 10:00:00 +0000 2025", "full_text": "x"},
+    }) is None
+
+
+def test_parse_page_reads_cursor_from_replace_entry():
+    page = {"data": {"search_by_raw_query": {"search_timeline": {"timeline": {"instructions": [
+        {"type": "TimelineAddEntries", "entries": []},
+        {"type": "TimelineReplaceEntry", "entry_id_to_replace": "cursor-bottom-0", "entry": {
+            "entryId": "cursor-bottom-0",
+            "content": {"entryType": "TimelineTimelineCursor", "value": "NEXT", "cursorType": "Bottom"},
+        }},
+    ]}}}}}
+
+    tweets, cursor = AsyncTwitterScraper("nasa")._parse_page(page)
+
+    assert tweets == []
+    assert cursor == "NEXT"
+
+
+def test_parse_page_handles_empty_response():
+    assert AsyncTwitterScraper("nasa")._parse_page({}) == ([], None)
+
+
+def test_articles_to_dataframe_sorts_by_date_with_undated_first():
+    df = articles_to_dataframe([
+        Article("2025-01-24T14:47:25.000Z", "later", None),
+        Article(None, "undated", None),
+        Article("2025-01-23T09:00:00.000Z", "earlier", "https://pbs.twimg.com/media/x.jpg"),
+    ])
+
+    assert list(df.columns) == ['ID', 'Date', 'Post Text', 'Image URL']
+    assert list(df['Post Text']) == ["undated", "earlier", "later"]
+    assert df['ID'].is_unique
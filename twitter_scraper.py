@@ -1,26 +1,91 @@
-import time
 from selenium import webdriver
-from selenium.common.exceptions import (
-    StaleElementReferenceException,
-    TimeoutException,
-    NoSuchElementException
-)
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import json
+import hashlib
 import logging
 from datetime import datetime
-from collections import OrderedDict
+from collections import namedtuple
 from urllib.parse import quote
 from typing import Optional
 import pandas as pd
-from bs4 import BeautifulSoup
 import uuid
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+COLLECT_ARTICLES_JS = """
+return Array.from(document.querySelectorAll('article')).map(a => {
+    const t = a.querySelector('time');
+    const img = a.querySelectorAll('img.css-9pa8cd')[1];
+    return {
+        timestamp: t ? t.getAttribute('datetime') : null,
+        text: a.textContent,
+        image_url: img ? img.getAttribute('src') : null
+    };
+});
+"""
+
+SCROLL_PAGE_JS = """
+const [amount, initialHeight, timeoutMs, done] = arguments;
+window.scrollBy(0, amount);
+const deadline = performance.now() + timeoutMs;
+(function check() {
+    if (document.documentElement.scrollHeight > initialHeight) {
+        return done(true);
+    }
+    if (performance.now() >= deadline) {
+        // Try to trigger lazy loading before the next attempt
+        window.dispatchEvent(new Event('scroll'));
+        window.dispatchEvent(new Event('wheel'));
+        return done(false);
+    }
+    setTimeout(check, 100);
+})();
+"""
+
+# Compact record for a collected article, far lighter than a dict per tweet
+Article = namedtuple('Article', ['timestamp', 'text', 'image_url'])
+
+def build_search_query(
+        search_query: str,
+        from_account: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None
+    ) -> str:
+    """Build the raw Twitter search query string."""
+    query_parts = [search_query]
+    
+    if from_account:
+        query_parts.append(f"(from:{from_account})")
+    
+    if start_date:
+        query_parts.append(f"since:{start_date}")
+        
+    if end_date:
+        query_parts.append(f"until:{end_date}")
+    
+    return " ".join(query_parts)
+
+def articles_to_dataframe(articles: list) -> pd.DataFrame:
+    """Format article records as a DataFrame sorted by date"""
+    df = pd.DataFrame({
+        'ID': [str(uuid.uuid4()) for _ in range(len(articles))],
+        'Date': [a.timestamp for a in articles],
+        'Post Text': [a.text for a in articles],
+        'Image URL': [a.image_url for a in articles],
+    })
+    # Undated articles go first, as they did when sorting on an empty string
+    return df.sort_values('Date', na_position='first', kind='stable', ignore_index=True)
+
+# Images are deliberately not blocked: the css-9pa8cd <img> the image URL is read
+# from is only rendered while its image loads, so a blocked load would drop it
+BLOCKED_RESOURCE_URLS = [
+    '*.mp4', '*.m3u8', '*video.twimg.com/*', '*.woff', '*.woff2', '*.css',
+]
+
 class TwitterScraper:
     def __init__(
             self,
@@ -31,7 +96,8 @@ class TwitterScraper:
             scroll_pause_time:int=3, 
             initial_wait:int=7,
             scroll_attempt_limit:int=5,
-            scroll_pixel_increment:int=1000
+            scroll_pixel_increment:int=1000,
+            block_resources:bool=True
         ):
         self.search_query = search_query
         self.from_account = from_account
@@ -41,26 +107,18 @@ class TwitterScraper:
         self.initial_wait = initial_wait
         self.scroll_attempt_limit = scroll_attempt_limit
         self.scroll_pixel_increment = scroll_pixel_increment
+        self.block_resources = block_resources
         self.driver = None
-        self.article_htmls = OrderedDict()
+        self.output_file = None
+        # Article records keyed by timestamp, or a content digest when undated
+        self.articles = {}
         self.last_height = 0
+        query_string = build_search_query(search_query, from_account, start_date, end_date)
+        self._search_url = f"https://x.com/search?q={quote(query_string)}&f=live"
         
     def _construct_search_url(self) -> str:
-        """Construct the search URL with all parameters."""
-        query_parts = [self.search_query]
-        
-        if self.from_account:
-            query_parts.append(f"(from:{self.from_account})")
-        
-        if self.start_date:
-            query_parts.append(f"since:{self.start_date}")
-            
-        if self.end_date:
-            query_parts.append(f"until:{self.end_date}")
-        
-        query_string = " ".join(query_parts)
-        encoded_query = quote(query_string)
-        return f"https://x.com/search?q={encoded_query}&f=live"
+        """Return the search URL built in __init__."""
+        return self._search_url
     
     def setup_driver(self):
         """Initialize and setup the Chrome driver"""
@@ -73,9 +131,14 @@ class TwitterScraper:
         chrome_options.add_argument("--disable-popup-blocking")
 
         self.driver = webdriver.Chrome(options=chrome_options)
-        search_url = self._construct_search_url()
-        logging.info(f"Loading search URL: {search_url}")
-        self.driver.get(search_url)
+        # scroll_page waits inside an async script, so allow for the full pause
+        self.driver.set_script_timeout(self.scroll_pause_time + 10)
+        if self.block_resources:
+            # Skip downloading video, fonts and stylesheets the scrape never reads
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_RESOURCE_URLS})
+        logging.info(f"Loading search URL: {self._search_url}")
+        self.driver.get(self._search_url)
         
     def load_cookies(self, cookie_file):
         """Load and add cookies from a JSON file"""
@@ -87,8 +150,7 @@ class TwitterScraper:
                     self.driver.add_cookie(cookie)
                 except Exception as e:
                     logging.warning(f"Failed to add cookie {cookie.get('name')}: {str(e)}")
-            self.driver.refresh()
-            self.driver.get(self._construct_search_url())
+            self.driver.get(self._search_url)
         except FileNotFoundError:
             logging.error(f"Cookie file {cookie_file} not found")
             raise
@@ -118,67 +180,62 @@ class TwitterScraper:
         ]
 
         for scroll_amount in scroll_amounts:
-            # Scroll and wait
-            self.driver.execute_script(f"window.scrollBy(0, {scroll_amount});")
-            time.sleep(self.scroll_pause_time)
-            
-            # Check for new content
-            new_height = self.driver.execute_script("return document.documentElement.scrollHeight")
-            if new_height > initial_height:
+            # Scroll, wait for new content and nudge lazy loading in one round-trip
+            if self.driver.execute_async_script(
+                SCROLL_PAGE_JS, scroll_amount, initial_height, self.scroll_pause_time * 1000
+            ):
                 return True
-                
-            # Try to trigger lazy loading
-            self.driver.execute_script("""
-                window.dispatchEvent(new Event('scroll'));
-                window.dispatchEvent(new Event('wheel'));
-            """)
-            time.sleep(1)
         
         return False
             
     def collect_articles(self):
         """Collect all articles from the current page"""
         try:
-            articles = self.wait_for_elements(By.TAG_NAME, "article")
-            for article in articles:
-                try:
-                    html_content = article.get_attribute("innerHTML")
-                    if not html_content:
-                        continue
-                    
-                    try:
-                        time_element = article.find_element(By.TAG_NAME, "time")
-                        tweet_time = time_element.get_attribute("datetime")
-                        key = tweet_time
-                    except NoSuchElementException:
-                        key = html_content
-                    
-                    if key not in self.article_htmls:
-                        self.article_htmls[key] = {
-                            "html": html_content,
-                            "timestamp": tweet_time if 'tweet_time' in locals() else None # this wild
-                        }
-                except StaleElementReferenceException:
+            if not self.wait_for_elements(By.TAG_NAME, "article"):
+                return
+            # Extract every article's timestamp, text and image URL in the
+            # browser in a single round-trip, so no raw HTML is kept around
+            page_articles = self.driver.execute_script(COLLECT_ARTICLES_JS)
+            for article in page_articles:
+                if not article['text']:
                     continue
+
+                # Fall back to a compact digest of the content when there is no timestamp
+                key = article['timestamp'] or hashlib.blake2b(
+                    f"{article['text']}\0{article['image_url']}".encode(), digest_size=16
+                ).digest()
+                if key not in self.articles:
+                    self.articles[key] = Article(article['timestamp'], article['text'], article['image_url'])
+                    if self.output_file:
+                        self.output_file.write(json.dumps(article) + '\n')
+            if self.output_file:
+                self.output_file.flush()
         except Exception as e:
             logging.error(f"Error collecting articles: {str(e)}")
             
     def save_progress(self):
-        """Save scraped data to a file"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"./output/twitter_search_{timestamp}.txt"
-        with open(filename, 'w', encoding='utf-8') as f:
-            for article_data in self.article_htmls.values():
-                f.write(f"Timestamp: {article_data['timestamp']}\n")
-                f.write(f"{article_data['html']}\n---\n")
-        logging.info(f"Saved {len(self.article_htmls)} articles to {filename}")
+        """Close the JSONL file the scraped articles were streamed to"""
+        if not self.output_file:
+            return
+        self.output_file.close()
+        logging.info(f"Saved {len(self.articles)} articles to {self.output_file.name}")
+        self.output_file = None
             
     def scrape(self, max_scrolls=None, save_screenshots=False, new_content_retries=3):
         """Main scraping method"""
         try:
             # Initial page setup
             logging.info(f"Starting search for: {self.search_query}")
-            time.sleep(self.initial_wait)
+            # Articles are streamed here as they are collected
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            self.output_file = open(f"./output/twitter_search_{timestamp}.jsonl", 'a', encoding='utf-8')
+
+            try:
+                WebDriverWait(self.driver, self.initial_wait, poll_frequency=0.25).until(
+                    EC.presence_of_element_located((By.TAG_NAME, "article"))
+                )
+            except TimeoutException:
+                logging.warning(f"No articles loaded after {self.initial_wait}s")
             
             scroll_count = 0
             no_new_content_count = 0
@@ -188,13 +245,13 @@ class TwitterScraper:
                     logging.info("Reached maximum scroll limit")
                     break
                     
-                prev_count = len(self.article_htmls)
+                prev_count = len(self.articles)
                 self.collect_articles()
                 
                 if save_screenshots:
                     self.driver.save_screenshot(f'scroll_{scroll_count}.png')
                 
-                if len(self.article_htmls) == prev_count:
+                if len(self.articles) == prev_count:
                     no_new_content_count += 1
                     if no_new_content_count >= new_content_retries:  # Try this many times before giving up
                         logging.info("No new content found after multiple attempts")
@@ -207,50 +264,23 @@ class TwitterScraper:
 
                     # One final check for new content
                     self.collect_articles()
-                    if len(self.article_htmls) == prev_count:
+                    if len(self.articles) == prev_count:
                         logging.info("No new content found after final check")
                         break
                 
                 scroll_count += 1
-                logging.info(f"Scroll {scroll_count}: Found {len(self.article_htmls)} unique articles")
-                
-            self.save_progress()
+                logging.info(f"Scroll {scroll_count}: Found {len(self.articles)} unique articles")
             
         except Exception as e:
             logging.error(f"Scraping error: {str(e)}")
             raise
         finally:
+            self.save_progress()
             if self.driver:
                 self.driver.quit()
 
-        self.sorted_articles = sorted(
-            self.article_htmls.values(),
-            key=lambda x: x['timestamp'] if x['timestamp'] else ''
-        )
-        return [article['html'] for article in self.sorted_articles]
+        return list(self.articles.values())
         
     def format_articles(self) -> pd.DataFrame:
         """Format the scraped articles as a DataFrame"""
-        data = []
-
-        def get_relevant_info(soup: BeautifulSoup) -> tuple:
-            post_text = soup.get_text()
-            
-            poss_img = soup.find_all('img', attrs={'class':'css-9pa8cd'})
-            if len(poss_img) > 1:
-                img_html = poss_img[1]
-                image_url = img_html['src']
-            else:
-                image_url = None
-            return post_text, image_url
-    
-
-        for d in self.sorted_articles:
-            date = d['timestamp']
-            article = d['html']
-            name = str(uuid.uuid4())
-            soup = BeautifulSoup(article, features="html.parser")
-            post_text, image_url = get_relevant_info(soup)
-            data.append((name, date, post_text, image_url))
-        
-        return pd.DataFrame(data, columns=['ID', 'Date', 'Post Text', 'Image URL'])
\ No newline at end of file
+        return articles_to_dataframe(list(self.articles.values()))
\ No newline at end of file